@@ -1,105 +1,410 @@
 import argparse
+import gzip
 import logging
-import csv
-import pandas as pd
+import mmap
+import multiprocessing
+import os
+import shutil
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from time import time
 from concurrent.futures import ProcessPoolExecutor
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler("log_parser.log", mode="w"),
-    ],
-)
-
-CHUNK_SIZE = 10_000
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+
+CHUNK_SIZE = 65_536
+READ_BLOCK_SIZE = 1 << 20
 EXCEL_ROW_LIMIT = 1_048_576
+SHARD_THRESHOLD = 64 * 1024 * 1024  # Shard single-file CSV conversions above this size.
+COMPRESS_SUFFIXES = {"gzip1": ".gz", "zstd": ".zst"}
+# Integer-valued W3C fields; IIS writes '-' for absent values, which map to null.
+IIS_INT32_FIELDS = {"sc-status", "sc-substatus", "sc-win32-status", "s-port"}
+IIS_INT64_FIELDS = {"sc-bytes", "cs-bytes", "time-taken"}
+
+# Single C pass over the line; measured as fast as or faster than
+# bytes.replace for space-dense IIS rows, where memchr-style skipping
+# restarts at every delimiter.
+SPACE_TO_COMMA = bytes.maketrans(b" ", b",")
+
+
+def iter_log_lines(file_path):
+    """
+    Yield data lines from a memory-mapped IIS log as raw bytes, skipping
+    directive and blank lines without decoding them.
+
+    Lines are carved out of 1MB blocks with one bytes.split per block, so
+    newline scanning runs in bulk C code instead of one readline call per
+    row; a partial trailing line is carried over into the next block.
+    """
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        size = len(mm)
+        pos = 0
+        tail = b""
+        while pos < size:
+            block = tail + mm[pos:pos + READ_BLOCK_SIZE]
+            pos += READ_BLOCK_SIZE
+            lines = block.split(b"\n")
+            tail = lines.pop()
+            for raw in lines:
+                # Byte-index filtering instead of strip+startswith: the
+                # split already removed \n and IIS writes no leading
+                # whitespace, so only a trailing \r (and, rarely, trailing
+                # spaces) needs trimming before the directive check.
+                if raw.endswith(b"\r"):
+                    raw = raw[:-1]
+                if not raw or raw[0] == 0x23:  # blank or '#' directive
+                    continue
+                if raw.endswith(b" "):
+                    raw = raw.rstrip()
+                yield raw
+        if tail.endswith(b"\r"):
+            tail = tail[:-1]
+        if tail and tail[0] != 0x23:
+            yield tail.rstrip() if tail.endswith(b" ") else tail
 
 
 def validate_log_data(file_path):
     """
     Validate IIS log data and extract headers and a generator for rows.
-    """
-    with open(file_path, "r", encoding="utf-8") as f:
-        headers = None
-        log_lines = []
-        for line in f:
-            if line.startswith("#Fields"):
-                headers = line.strip().split(" ")[1:]
-            elif not line.startswith("#") and line.strip():
-                log_lines.append(line.strip())
-        if not headers:
-            raise ValueError(f"No #Fields line found in log file: {file_path}")
-        if not log_lines:
-            raise ValueError(f"No valid data lines found in log file: {file_path}")
-    return headers, (line for line in log_lines)
 
+    Headers are located by jumping straight to the last #Fields directive
+    with rfind rather than visiting every line; the forward scan this
+    replaces kept the last directive too (IIS rewrites the block on
+    restart), so last-wins behavior is preserved. The data-line check
+    stops at the first non-directive line instead of reading the file.
+    """
+    # mmap refuses empty files with an opaque ValueError; keep the
+    # operator-facing message for zero-byte logs.
+    if os.stat(file_path).st_size == 0:
+        raise ValueError(f"No #Fields line found in log file: {file_path}")
+    headers = None
+    has_data = False
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        size = len(mm)
+        hdr_start = mm.rfind(b"#Fields")
+        while hdr_start > 0 and mm[hdr_start - 1] not in (0x0A, 0x0D):
+            # Matched "#Fields" inside a data field; keep looking backwards
+            # for an occurrence at the start of a line.
+            hdr_start = mm.rfind(b"#Fields", 0, hdr_start)
+        if hdr_start != -1:
+            hdr_end = mm.find(b"\n", hdr_start)
+            if hdr_end == -1:
+                hdr_end = size
+            headers = mm[hdr_start:hdr_end].strip().decode("utf-8").split(" ")[1:]
+
+        pos = 0
+        while pos < size:
+            newline = mm.find(b"\n", pos)
+            end = size if newline == -1 else newline
+            raw = mm[pos:end].strip()
+            pos = size if newline == -1 else newline + 1
+            if raw and not raw.startswith(b"#"):
+                has_data = True
+                break
+    if not headers:
+        raise ValueError(f"No #Fields line found in log file: {file_path}")
+    if not has_data:
+        raise ValueError(f"No valid data lines found in log file: {file_path}")
+    return headers, iter_log_lines(file_path)
+
+
+def _csv_row(raw, n_fields):
+    """
+    Transform one raw log line into a CSV row as bytes, or None if the
+    field count is wrong.
 
-def write_to_csv(destination_file, headers, log_line_generator):
+    Clean rows — single-space delimited with no commas or quotes — are
+    translated in one C pass. Rows containing the delimiter or quote
+    character (cs(User-Agent) values routinely hold commas) get
+    csv.QUOTE_MINIMAL-style quoting so parsers see the right field count.
     """
-    Write log data to a CSV file in chunks, ensuring proper handling of fields with commas.
+    if b"," not in raw and b'"' not in raw:
+        # Fast path: exactly n_fields-1 single-space delimiters means the
+        # whole row transform is one C-level byte translation with no
+        # intermediate token objects.
+        if raw.count(b" ") == n_fields - 1 and b"  " not in raw:
+            return raw.translate(SPACE_TO_COMMA)
+        # Bounded split: stop scanning once n_fields-1 delimiters are found,
+        # so a trailing field is never over-split. Reuse the parts for both
+        # the field-count check and the output.
+        parts = raw.split(None, n_fields - 1)
+        if len(parts) != n_fields:
+            return None
+        return b",".join(parts)
+    parts = raw.split(None, n_fields - 1)
+    if len(parts) != n_fields:
+        return None
+    return b",".join(
+        b'"' + part.replace(b'"', b'""') + b'"' if (b"," in part or b'"' in part) else part
+        for part in parts
+    )
+
+
+def open_csv_sink(destination_file, compress):
     """
-    with open(destination_file, "w", newline="", encoding="utf-8") as out_file:
-        writer = csv.writer(out_file, quoting=csv.QUOTE_MINIMAL)
-        writer.writerow(headers)  # Write headers to the CSV file
+    Open the binary sink for a CSV byte stream, honoring --compress.
+
+    Level-1 codecs cost little CPU on repetitive log text, so the write
+    stays IO-limited while disk bytes drop severalfold. The uncompressed
+    sink is unbuffered, keeping the one-syscall-per-chunk behavior.
+    """
+    if compress == "gzip1":
+        return gzip.open(destination_file, "wb", compresslevel=1)
+    if compress == "zstd":
+        import zstandard
+
+        return zstandard.open(destination_file, "wb", cctx=zstandard.ZstdCompressor(level=1))
+    return open(destination_file, "wb", buffering=0)
 
+
+def write_to_csv(destination_file, headers, log_line_generator, compress="none"):
+    """
+    Stream log data to a CSV file entirely in the bytes domain, flushing
+    each chunk as one pre-joined buffer with a single write call.
+    """
+    n_fields = len(headers)
+    with open_csv_sink(destination_file, compress) as out_file:
+        out_file.write(",".join(headers).encode("utf-8") + b"\n")
         chunk = []
-        for line in log_line_generator:
-            # Split the line into fields and write it to the CSV
-            chunk.append(line.split())
+        for raw in log_line_generator:
+            row = _csv_row(raw, n_fields)
+            if row is None:
+                logging.warning(f"Skipping malformed line ({len(raw.split(None, n_fields - 1))} fields, expected {n_fields}): {raw.decode('utf-8', 'replace')}")
+                continue
+            chunk.append(row)
             if len(chunk) >= CHUNK_SIZE:
-                writer.writerows(chunk)
+                out_file.write(b"\n".join(chunk) + b"\n")
                 chunk.clear()
         if chunk:
-            writer.writerows(chunk)
+            out_file.write(b"\n".join(chunk) + b"\n")
 
 
-def write_to_excel(destination_file, headers, log_line_generator):
+def convert_csv_shard(args):
     """
-    Write log data to an Excel file in chunks, handling row limits.
+    Convert one byte range of a log file to a headerless CSV part file.
+
+    A line belongs to the shard that contains its first byte, so shard
+    starts are advanced to the next line boundary and the final line of a
+    range is read through past the end offset.
+    """
+    log_file, start, end, n_fields, part_file, compress = args
+    with open_csv_sink(part_file, compress) as out_file:
+        with open(log_file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            pos = 0 if start == 0 else mm.find(b"\n", start - 1) + 1
+            if pos == 0 and start > 0:  # no line starts inside this range
+                return
+            chunk = []
+            while pos < end:
+                newline = mm.find(b"\n", pos)
+                if newline == -1:
+                    raw, pos = mm[pos:size], size
+                else:
+                    raw, pos = mm[pos:newline], newline + 1
+                if raw.endswith(b"\r"):
+                    raw = raw[:-1]
+                if not raw or raw[0] == 0x23:  # blank or '#' directive
+                    continue
+                if raw.endswith(b" "):
+                    raw = raw.rstrip()
+                row = _csv_row(raw, n_fields)
+                if row is None:
+                    logging.warning(f"Skipping malformed line ({len(raw.split(None, n_fields - 1))} fields, expected {n_fields}): {raw.decode('utf-8', 'replace')}")
+                    continue
+                chunk.append(row)
+                if len(chunk) >= CHUNK_SIZE:
+                    out_file.write(b"\n".join(chunk) + b"\n")
+                    chunk.clear()
+            if chunk:
+                out_file.write(b"\n".join(chunk) + b"\n")
+
+
+def convert_log_to_csv_sharded(log_file, destination_file, compress="none"):
     """
-    with pd.ExcelWriter(destination_file, engine="openpyxl") as writer:
+    Convert a single large log to CSV by assigning byte ranges of the file
+    to worker processes, then concatenating the resulting part files.
+
+    Compressed shards concatenate as-is: gzip members and zstd frames are
+    both valid back to back in one stream.
+    """
+    headers, _ = validate_log_data(log_file)
+    n_fields = len(headers)
+    size = log_file.stat().st_size
+    n_shards = os.cpu_count() or 1
+    offsets = [i * size // n_shards for i in range(n_shards + 1)]
+    part_files = [destination_file.with_suffix(f".part{i}") for i in range(n_shards)]
+    shard_args = [
+        (log_file, offsets[i], offsets[i + 1], n_fields, part_files[i], compress)
+        for i in range(n_shards)
+    ]
+    log_queue, listener = _start_log_listener()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=n_shards, initializer=_init_worker, initargs=(log_queue, "csv")
+        ) as executor:
+            list(executor.map(convert_csv_shard, shard_args))
+    finally:
+        listener.stop()
+
+    with open_csv_sink(destination_file, compress) as out_file:
+        out_file.write(",".join(headers).encode("utf-8") + b"\n")
+    with open(destination_file, "ab") as out_file:
+        for part_file in part_files:
+            with open(part_file, "rb") as part:
+                shutil.copyfileobj(part, out_file, 1 << 20)
+            part_file.unlink()
+
+
+def iter_excel_rows(headers, log_line_generator):
+    """
+    Yield validated, tokenized rows for the Excel writers.
+    """
+    n_fields = len(headers)
+    for raw in log_line_generator:
+        line = raw.decode("utf-8")
+        parts = line.split(None, n_fields - 1)
+        if len(parts) != n_fields:
+            logging.warning(f"Skipping malformed line ({len(parts)} fields, expected {n_fields}): {line}")
+            continue
+        yield parts
+
+
+def _write_excel_xlsxwriter(destination_file, headers, rows):
+    import xlsxwriter
+
+    workbook = xlsxwriter.Workbook(
+        destination_file, {"constant_memory": True, "strings_to_numbers": False}
+    )
+    try:
         sheet_number = 1
-        current_row_count = 0
-        chunk = []
-        for line in log_line_generator:
-            chunk.append(line.split())
-            current_row_count += 1
-            if len(chunk) >= CHUNK_SIZE:
-                pd.DataFrame(chunk, columns=headers).to_excel(
-                    writer, index=False, sheet_name=f"Sheet{sheet_number}"
-                )
-                chunk.clear()
-            if current_row_count >= EXCEL_ROW_LIMIT:
+        worksheet = workbook.add_worksheet(f"Sheet{sheet_number}")
+        worksheet.write_row(0, 0, headers)
+        row_index = 1
+        for parts in rows:
+            if row_index >= EXCEL_ROW_LIMIT:
                 sheet_number += 1
-                current_row_count = 0
-        if chunk:
-            pd.DataFrame(chunk, columns=headers).to_excel(
-                writer, index=False, sheet_name=f"Sheet{sheet_number}"
-            )
+                worksheet = workbook.add_worksheet(f"Sheet{sheet_number}")
+                worksheet.write_row(0, 0, headers)
+                row_index = 1
+            worksheet.write_row(row_index, 0, parts)
+            row_index += 1
+    finally:
+        workbook.close()
+
+
+def _write_excel_openpyxl(destination_file, headers, rows):
+    import openpyxl
+
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet_number = 1
+    worksheet = workbook.create_sheet(f"Sheet{sheet_number}")
+    worksheet.append(headers)
+    row_count = 1
+    for parts in rows:
+        if row_count >= EXCEL_ROW_LIMIT:
+            sheet_number += 1
+            worksheet = workbook.create_sheet(f"Sheet{sheet_number}")
+            worksheet.append(headers)
+            row_count = 1
+        worksheet.append(parts)
+        row_count += 1
+    workbook.save(destination_file)
+
+
+def write_to_excel(destination_file, headers, log_line_generator):
+    """
+    Write log data to an Excel file row by row, rolling over to a new
+    sheet at the row limit. Prefers xlsxwriter in constant-memory mode
+    and falls back to an openpyxl write-only workbook; both flush rows to
+    disk instead of holding the whole cell graph in RAM.
+    """
+    rows = iter_excel_rows(headers, log_line_generator)
+    try:
+        import xlsxwriter  # noqa: F401
+    except ImportError:
+        _write_excel_openpyxl(destination_file, headers, rows)
+        return
+    _write_excel_xlsxwriter(destination_file, headers, rows)
+
+
+def write_to_arrow(destination_file, headers, log_line_generator, output_format, compress="none"):
+    """
+    Write log data to a Parquet, Feather or CSV file via a pyarrow Table.
+
+    The csv-arrow path trades the constant-memory streaming writer for
+    pyarrow's multithreaded C++ CSV writer, which is much faster on hosts
+    with RAM to hold the table; it honors --compress like the plain csv
+    writer. Parquet and feather carry their own compression.
+    """
+    import pyarrow as pa
+
+    n_fields = len(headers)
+    columns = [[] for _ in headers]
+    for raw in log_line_generator:
+        line = raw.decode("utf-8")
+        parts = line.split(None, n_fields - 1)
+        if len(parts) != n_fields:
+            logging.warning(f"Skipping malformed line ({len(parts)} fields, expected {n_fields}): {line}")
+            continue
+        # Append tokens straight into their columns; the row list and the
+        # transpose it would need are never materialized.
+        for i, part in enumerate(parts):
+            columns[i].append(part)
+
+    arrays = []
+    for header, column in zip(headers, columns):
+        if header in IIS_INT32_FIELDS or header in IIS_INT64_FIELDS:
+            col_type = pa.int32() if header in IIS_INT32_FIELDS else pa.int64()
+            try:
+                arrays.append(pa.array([int(value) if value != "-" else None for value in column], type=col_type))
+                continue
+            except (ValueError, OverflowError):
+                logging.warning(f"Column {header} has non-integer values; keeping it as strings")
+        arrays.append(pa.array(column, type=pa.string()))
+    table = pa.Table.from_arrays(arrays, names=headers)
+
+    if output_format == "parquet":
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, destination_file, compression="zstd")
+    elif output_format == "feather":
+        from pyarrow import feather
+
+        feather.write_feather(table, destination_file)
+    else:
+        import pyarrow.csv as pacsv
+
+        write_options = pacsv.WriteOptions(include_header=True, batch_size=CHUNK_SIZE)
+        if compress in COMPRESS_SUFFIXES:
+            with open_csv_sink(destination_file, compress) as out_file:
+                pacsv.write_csv(table, out_file, write_options=write_options)
+        else:
+            pacsv.write_csv(table, destination_file, write_options=write_options)
 
 
 def convert_log_to_output(args):
     """
     Convert a single IIS log file to the specified output format.
     """
-    log_file, source_dir, destination_dir, output_format = args
+    log_file, source_dir, destination_dir, output_format, compress = args
     try:
         relative_path = log_file.relative_to(source_dir)
         destination_file = destination_dir / relative_path
-        destination_file = destination_file.with_suffix(f".{output_format.lower()}")
+        suffix = "csv" if output_format.lower() == "csv-arrow" else output_format.lower()
+        destination_file = destination_file.with_suffix(f".{suffix}")
+        if suffix == "csv" and compress in COMPRESS_SUFFIXES:
+            destination_file = destination_file.with_name(destination_file.name + COMPRESS_SUFFIXES[compress])
         destination_file.parent.mkdir(parents=True, exist_ok=True)
 
         headers, log_line_generator = validate_log_data(log_file)
 
-        if output_format.lower() == "csv":
-            write_to_csv(destination_file, headers, log_line_generator)
-        elif output_format.lower() == "xlsx":
+        output_format = output_format.lower()
+        if output_format == "csv":
+            write_to_csv(destination_file, headers, log_line_generator, compress)
+        elif output_format == "xlsx":
             write_to_excel(destination_file, headers, log_line_generator)
+        elif output_format in ("parquet", "feather", "csv-arrow"):
+            write_to_arrow(destination_file, headers, log_line_generator, output_format, compress)
         else:
             raise ValueError(f"Unsupported output format: {output_format}")
 
@@ -108,31 +413,113 @@ def convert_log_to_output(args):
         logging.error(f"Failed to process {log_file}: {e}")
 
 
-def process_log_files_parallel(log_files, source_dir, destination_dir, output_format):
+def _start_log_listener():
     """
-    Process log files in parallel using ProcessPoolExecutor.
+    Start a listener thread that drains worker log records from a queue
+    into the parent's handlers, so worker processes never contend on the
+    shared log file or interleave partial writes.
     """
-    args = [(log_file, source_dir, destination_dir, output_format) for log_file in log_files]
-    with ProcessPoolExecutor() as executor:
-        executor.map(convert_log_to_output, args)
+    log_queue = multiprocessing.Queue(-1)
+    listener = QueueListener(log_queue, *logging.getLogger().handlers)
+    listener.start()
+    return log_queue, listener
 
 
-def process_folder(source_dir, destination_dir, recurse, output_format):
+def _init_worker(log_queue, output_format):
+    """
+    Configure a pool worker: route its log records to the parent's queue
+    listener, and pre-import the writer dependencies the chosen format
+    needs so each worker pays the import cost once at pool start-up
+    instead of inside its first task.
+    """
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(log_queue)]
+    root.setLevel(logging.INFO)
+    if output_format in ("parquet", "feather", "csv-arrow"):
+        import pyarrow.csv  # noqa: F401
+        import pyarrow.feather  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    elif output_format == "xlsx":
+        try:
+            import xlsxwriter  # noqa: F401
+        except ImportError:
+            import openpyxl  # noqa: F401
+
+
+def iter_log_files(source_dir, recurse):
+    """
+    Yield *.log files under source_dir using os.scandir, whose directory
+    entries carry cached type information, instead of materializing a
+    Path.glob listing up front.
+    """
+    stack = [source_dir]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recurse:
+                            stack.append(entry.path)
+                    elif entry.name.endswith(".log"):
+                        yield Path(entry.path)
+        except OSError as e:
+            # An unreadable directory shouldn't abort the whole run; skip
+            # it the way Path.rglob suppresses PermissionError.
+            logging.warning(f"Skipping unreadable directory {current}: {e}")
+
+
+def process_log_files_parallel(log_files, source_dir, destination_dir, output_format, compress):
+    """
+    Process log files in parallel using ProcessPoolExecutor, dispatching
+    paths to the pool as the directory walk discovers them. Returns the
+    number of files processed.
+    """
+    args = ((log_file, source_dir, destination_dir, output_format, compress) for log_file in log_files)
+    n_workers = os.cpu_count() or 1
+    count = 0
+    log_queue, listener = _start_log_listener()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=n_workers, initializer=_init_worker, initargs=(log_queue, output_format)
+        ) as executor:
+            # A small fixed chunksize batches pickle/IPC round-trips without
+            # starving workers: per-file conversion dwarfs dispatch cost, so
+            # the batch must stay well below files-per-worker for typical
+            # folders. (The task count isn't known up front with a lazy
+            # walk.) Consuming the iterator also surfaces dispatch errors.
+            for _ in executor.map(convert_log_to_output, args, chunksize=4):
+                count += 1
+    finally:
+        listener.stop()
+    return count
+
+
+def process_folder(source_dir, destination_dir, recurse, output_format, compress):
     """
     Process all log files in a folder, maintaining the folder structure.
     """
-    log_files = source_dir.rglob("*.log") if recurse else source_dir.glob("*.log")
-    log_files = list(log_files)
+    log_files = iter_log_files(source_dir, recurse)
+    count = process_log_files_parallel(log_files, source_dir, destination_dir, output_format, compress)
 
-    if not log_files:
+    if not count:
         logging.warning(f"No log files found in: {source_dir}")
         return
-
-    logging.info(f"Found {len(log_files)} log files in: {source_dir}")
-    process_log_files_parallel(log_files, source_dir, destination_dir, output_format)
+    logging.info(f"Processed {count} log files from: {source_dir}")
 
 
 def main():
+    # Configured here rather than at import time so spawned workers don't
+    # re-open (and truncate) the log file when they import this module.
+    logging.basicConfig(
+        level=logging.INFO,
+        format=LOG_FORMAT,
+        handlers=[
+            logging.StreamHandler(),
+            logging.FileHandler("log_parser.log", mode="w"),
+        ],
+    )
+
     parser = argparse.ArgumentParser(description="IIS Log Parser")
     group = parser.add_mutually_exclusive_group(required=True)
 
@@ -142,7 +529,8 @@ def main():
     group.add_argument("--folder", type=str, help="Path to a folder containing IIS logs.")
     parser.add_argument("--output-folder", type=str, help="Path to output folder for processed logs.")
     parser.add_argument("--recurse", action="store_true", help="Recursively find logs in subdirectories.")
-    parser.add_argument("--format", type=str, default="csv", choices=["csv", "xlsx"], help="Output file format (default: csv).")
+    parser.add_argument("--format", type=str, default="csv", choices=["csv", "csv-arrow", "xlsx", "parquet", "feather"], help="Output file format (default: csv).")
+    parser.add_argument("--compress", type=str, default="none", choices=["none", "gzip1", "zstd"], help="Compress CSV output at write time (default: none).")
 
     args = parser.parse_args()
 
@@ -159,7 +547,20 @@ def main():
             logging.error("Output file path must be specified with --file.")
             return
 
-        convert_log_to_output((source_file, source_file.parent, destination_file.parent, args.format))
+        if args.format == "csv" and source_file.stat().st_size >= SHARD_THRESHOLD:
+            # One huge log would otherwise be converted on a single core;
+            # split it into byte ranges and convert the ranges in parallel.
+            try:
+                destination_file = destination_file.with_suffix(".csv")
+                if args.compress in COMPRESS_SUFFIXES:
+                    destination_file = destination_file.with_name(destination_file.name + COMPRESS_SUFFIXES[args.compress])
+                destination_file.parent.mkdir(parents=True, exist_ok=True)
+                convert_log_to_csv_sharded(source_file, destination_file, args.compress)
+                logging.info(f"Converted: {source_file} -> {destination_file}")
+            except Exception as e:
+                logging.error(f"Failed to process {source_file}: {e}")
+        else:
+            convert_log_to_output((source_file, source_file.parent, destination_file.parent, args.format, args.compress))
 
     elif args.folder:
         source_dir = Path(args.folder)
@@ -172,7 +573,7 @@ def main():
             logging.error("Output folder path must be specified with --folder.")
             return
 
-        process_folder(source_dir, destination_dir, args.recurse, args.format)
+        process_folder(source_dir, destination_dir, args.recurse, args.format, args.compress)
 
     end_time = time()
     logging.info(f"Script completed in {end_time - start_time:.2f} seconds.")